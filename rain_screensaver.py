@@ -1,7 +1,8 @@
 import pygame
-import random
 import math
 import numpy as np
+from collections import defaultdict
+from pygame._sdl2.video import Window, Renderer, Texture
 
 # =============================================================================
 # CONFIGURATION - Adjust these parameters to modify the simulation
@@ -40,143 +41,30 @@ CANAL_STICK_STRENGTH = 0.8 # How strongly drops stick to canals
 
 # =============================================================================
 
-class WaterDroplet:
-    def __init__(self, x, y, mass):
-        self.x = x
-        self.y = y
-        self.mass = mass
-        self.velocity = 0
-        self.merged = False
-        self.radius = min(15, int(3 + (self.mass * 8)))
-        self.dx = 0  # Horizontal velocity
-        self.target_dx = 0  # Target horizontal velocity
-        self.movement_timer = random.random() * 6.28
-        self.stretch = 0.0
-        self.simulation = None
-        
-    def update(self, gravity, dt, canals):
-        if self.mass < DROP_MIN_MASS:
-            return False
-            
-        # Calculate gravity force component along the surface
-        gravity_force = gravity * math.sin(math.radians(SURFACE_ANGLE))
-        
-        # Smoother adhesion transition
-        adhesion = ADHESION_STRENGTH * (1 / (1 + (self.mass / CRITICAL_MASS) * 2))
-        
-        # Surface tension effects from other drops
-        target_dx = 0
-        tension_dy = 0
-        
-        # Find nearest canal influence
-        nearest_canal_dist = float('inf')
-        nearest_canal_dx = 0
-        canal_attraction = 0
-        is_on_canal = False
-        
-        # First find the strongest/nearest canal
-        strongest_canal = None
-        strongest_effect = 0
-        
-        for canal in canals:
-            dx = canal.x - self.x
-            dy = canal.y - self.y
-            dist = math.sqrt(dx*dx + dy*dy)
-            
-            if dist < CANAL_RANGE:
-                # Stronger effect for stronger canals
-                effect = canal.strength * (1 - (dist/CANAL_RANGE) ** 2)
-                if effect > strongest_effect:
-                    strongest_effect = effect
-                    strongest_canal = canal
-                    nearest_canal_dist = dist
-                    nearest_canal_dx = dx
-                    canal_attraction = effect
-                    is_on_canal = dist < CANAL_STICK_THRESHOLD
-
-        # Add drop-to-drop tension (reduced when on canal)
-        tension_multiplier = 0.2 if is_on_canal else 1.0
-        for other in self.simulation.droplets:
-            if other != self and not other.merged:
-                dx = other.x - self.x
-                dy = other.y - self.y
-                dist = math.sqrt(dx*dx + dy*dy)
-                
-                if dist < TENSION_RANGE:
-                    size_ratio = min(self.radius, other.radius) / max(self.radius, other.radius)
-                    strength = SURFACE_TENSION * (1 - (dist/TENSION_RANGE) ** 2) * size_ratio * tension_multiplier
-                    
-                    if dist > 0:
-                        target_dx += (dx / dist) * strength
-                        tension_dy += (dy / dist) * strength * 0.5
-
-        # Handle canal movement
-        if strongest_canal is not None:
-            if is_on_canal:
-                # Stick to canal
-                self.x = strongest_canal.x + (nearest_canal_dx * 0.1)  # Allow slight offset
-                target_dx *= (1 - CANAL_STICK_STRENGTH)  # Reduce other influences
-            else:
-                # Strong pull towards canal
-                canal_pull = (nearest_canal_dx / nearest_canal_dist) * CANAL_ALIGN_STRENGTH
-                target_dx += canal_pull * (1 + strongest_effect)  # Stronger pull for stronger canals
+# Derived constants, computed once instead of per drop per frame
+_SIN_ANGLE = math.sin(math.radians(SURFACE_ANGLE))
+_TENSION_RANGE_SQ = TENSION_RANGE * TENSION_RANGE
+_CANAL_RANGE_SQ = CANAL_RANGE * CANAL_RANGE
 
-        # Smooth horizontal velocity transition
-        self.dx = self.dx * 0.8 + target_dx * 0.2  # Faster response
-        
-        # Net acceleration with smoother transition
-        net_acceleration = gravity_force - adhesion
-        if is_on_canal:
-            net_acceleration += canal_attraction * 0.5  # Bonus speed in canals
-        
-        # Only move if forces overcome adhesion
-        if net_acceleration > 0:
-            # Smoother mass-based acceleration
-            mass_factor = math.log(1 + self.mass / CRITICAL_MASS) + 0.5
-            self.velocity += net_acceleration * dt * mass_factor
-            
-            # Smoother terminal velocity
-            max_speed = 3 * (1 + math.log(1 + self.mass))
-            if is_on_canal:
-                max_speed *= 1.2  # Faster in canals
-            self.velocity = min(self.velocity, max_speed)
-            
-            # Move drop with smoothed velocities
-            if not is_on_canal:
-                self.x += self.dx * dt * 20
-            self.y += (self.velocity + tension_dy) * dt * 15
-        
-        return True
-
-    def update_radius(self):
-        # Update radius when mass changes (e.g., after merging)
-        self.radius = min(15, int(3 + (self.mass * 8)))
-
-    def get_merge_radius(self):
-        # Merge radius is now just slightly larger than visual radius
-        return self.radius * 1.2  # 20% larger than visual radius for merging
-
-class Canal:
-    def __init__(self, x, y, strength=0.1):
-        self.x = x
-        self.y = y
-        self.strength = strength
-        self.width = CANAL_MIN_WIDTH
-        self.alpha = CANAL_MIN_ALPHA
-        self.length = CANAL_LENGTH
-        
-    def update(self):
-        self.strength = min(self.strength + CANAL_GROWTH_RATE, 1.0)
-        self.width = min(CANAL_MAX_WIDTH, self.width + self.strength * CANAL_WIDTH_GROWTH)
-        self.alpha = min(CANAL_MAX_ALPHA, CANAL_MIN_ALPHA + int(self.strength * 100))
-        
-    def draw(self, screen):
-        # Create gradient trail effect
-        for i in range(self.length):
-            alpha = self.alpha * (1 - i/self.length)  # Fade out towards bottom
-            surf = pygame.Surface((int(self.width), 2), pygame.SRCALPHA)
-            surf.fill((100, 150, 255, int(alpha)))
-            screen.blit(surf, (int(self.x - self.width/2), int(self.y + i*2)))
+def grid_key(x, y):
+    # Packs integer grid coordinates into a single int, cheaper to hash than a tuple
+    return (x << 20) | (y & 0xFFFFF)
+
+def droplet_radius(mass):
+    # Radius grows with mass (e.g., after merging)
+    return np.minimum(15, (3 + mass * 8).astype(int))
+
+def merge_radius(radius):
+    # Merge radius is now just slightly larger than visual radius
+    return radius * 1.2  # 20% larger than visual radius for merging
+
+def canal_gradient(width, alpha, length):
+    # Trail surface fading out towards the bottom, two rows per step
+    surf = pygame.Surface((width, length*2), pygame.SRCALPHA)
+    surf.fill((100, 150, 255, 0))
+    steps = (alpha * (1 - np.arange(length) / length)).astype(int)
+    pygame.surfarray.pixels_alpha(surf)[:] = np.repeat(steps, 2)
+    return surf
 
 class RainScreensaver:
     def __init__(self, width=800, height=600):
@@ -185,8 +73,10 @@ class RainScreensaver:
         self.width = screen_info.current_w
         self.height = screen_info.current_h
         
-        self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
-        pygame.display.set_caption("Rain on Glass")
+        # Frames are composed from textures by SDL's GPU renderer
+        self.window = Window("Rain on Glass", size=(self.width, self.height), fullscreen=True)
+        self.renderer = Renderer(self.window, accelerated=-1)  # Accelerated if available
+        self.renderer.draw_color = (0, 0, 0, 255)
         
         self.trail_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self.trail_surface.fill((0, 0, 0, 0))
@@ -197,131 +87,382 @@ class RainScreensaver:
         self.show_text = False  # Add text display toggle
         
         self.gravity = GRAVITY
-        self.droplets = []
-        self.canals = []
-        self.canal_grid = {}
+        self._rng = np.random.default_rng()
+        # Drop state, one preallocated array per property with a slot per drop.
+        # Floats are single precision, halving the memory the pairwise passes touch
+        self.px = np.zeros(MAX_DROPS, dtype=np.float32)
+        self.py = np.zeros(MAX_DROPS, dtype=np.float32)
+        self.vx = np.zeros(MAX_DROPS, dtype=np.float32)  # Horizontal velocity
+        self.vy = np.zeros(MAX_DROPS, dtype=np.float32)  # Vertical velocity
+        self.mass = np.zeros(MAX_DROPS, dtype=np.float32)
+        self.radius = np.zeros(MAX_DROPS, dtype=int)
+        self.alive = np.zeros(MAX_DROPS, dtype=bool)
+        self.alive_indices = np.zeros(0, dtype=int)  # Kept in sync with alive
+        # Canal state, one array per property, grown as canals are added.
+        # canal_left and canal_rect_w are the integer x and width of each canal's rect
+        self.n_canals = 0
+        self.canal_x = np.zeros(1024, dtype=np.float32)
+        self.canal_y = np.zeros(1024, dtype=np.float32)
+        self.canal_strength = np.zeros(1024, dtype=np.float32)
+        self.canal_width = np.zeros(1024, dtype=np.float32)
+        self.canal_alpha = np.zeros(1024, dtype=int)
+        self.canal_left = np.zeros(1024, dtype=int)
+        self.canal_rect_w = np.zeros(1024, dtype=int)
+        self.canal_grid = {}  # grid key -> canal index
         self.grid_size = CANAL_GRID_SIZE
-        
+        # Canal indices bucketed by CANAL_RANGE-sized cells for neighbourhood lookups
+        self.canal_spatial = defaultdict(list)
+
+        # Pre-rendered textures and surfaces, reused every frame
+        self._drop_cache = {}       # (radius, alpha bucket) -> drop body texture
+        self._highlight_cache = {}  # highlight size -> highlight texture
+        self._canal_cache = {}      # (width, alpha) -> canal gradient surface
+        self._font = pygame.font.SysFont('Arial', 10)
+        self._text_cache = {}       # text -> rendered label texture
+
+        # Canals are drawn onto a persistent background surface mirrored in a
+        # texture; each frame only the canal areas that changed are repainted
+        # and uploaded
+        self.background = None
+        self.background_texture = None
+        self.full_redraw = True
+        self.dirty_canal_rects = []
+
+    @property
+    def n_alive(self):
+        return len(self.alive_indices)
+
+    def add_droplets(self, xs, masses):
+        # New drops take the first free slots
+        slots = np.flatnonzero(~self.alive)[:len(xs)]
+        self.px[slots] = xs
+        self.py[slots] = 0
+        self.vx[slots] = 0
+        self.vy[slots] = 0
+        self.mass[slots] = masses
+        self.radius[slots] = droplet_radius(masses)
+        self.alive[slots] = True
+        self.alive_indices = np.flatnonzero(self.alive)
+
     def add_canal(self, x, y, drop_size):
         grid_x = round(x / self.grid_size) * self.grid_size
         grid_y = round(y / self.grid_size) * self.grid_size
-        key = (grid_x, grid_y)
+        key = grid_key(grid_x, grid_y)
         
-        if key not in self.canal_grid:
-            self.canal_grid[key] = Canal(grid_x, grid_y)
-            self.canals.append(self.canal_grid[key])
+        i = self.canal_grid.get(key)
+        if i is None:
+            i = self.n_canals
+            if i == len(self.canal_x):
+                self.grow_canals()
+            self.canal_x[i], self.canal_y[i] = grid_x, grid_y
+            self.canal_strength[i] = 0.1
+            self.canal_width[i] = CANAL_MIN_WIDTH
+            self.canal_alpha[i] = CANAL_MIN_ALPHA
+            self.canal_left[i] = int(grid_x - CANAL_MIN_WIDTH/2)
+            self.canal_rect_w[i] = int(CANAL_MIN_WIDTH)
+            self.n_canals += 1
+            self.canal_grid[key] = i
+            self.canal_spatial[grid_key(grid_x // CANAL_RANGE, grid_y // CANAL_RANGE)].append(i)
         else:
-            self.canal_grid[key].strength = min(1.0, self.canal_grid[key].strength + 0.1)
-            
+            self.canal_strength[i] = min(1.0, self.canal_strength[i] + 0.1)
+
+    def grow_canals(self):
+        # Double the capacity of every canal array
+        for name in ('canal_x', 'canal_y', 'canal_strength', 'canal_width',
+                     'canal_alpha', 'canal_left', 'canal_rect_w'):
+            arr = getattr(self, name)
+            setattr(self, name, np.concatenate([arr, np.zeros_like(arr)]))
+
+    def canal_rect(self, i):
+        return pygame.Rect(int(self.canal_left[i]), int(self.canal_y[i]),
+                           int(self.canal_rect_w[i]), CANAL_LENGTH*2)
+
+    def canal_blits(self, ids):
+        # (surface, position) pairs; gradients are shared by canals with the same width and alpha
+        blits = []
+        for left, y, width, alpha in zip(self.canal_left[ids].tolist(), self.canal_y[ids].tolist(),
+                                         self.canal_rect_w[ids].tolist(), self.canal_alpha[ids].tolist()):
+            surface = self._canal_cache.get((width, alpha))
+            if surface is None:
+                surface = self._canal_cache[(width, alpha)] = canal_gradient(width, alpha, CANAL_LENGTH)
+            blits.append((surface, (left, int(y))))
+        return blits
+
+    def update_canals(self):
+        # Grow every canal at once and record the screen areas of those whose look changed
+        n = self.n_canals
+        strength, width = self.canal_strength[:n], self.canal_width[:n]
+        np.minimum(strength + CANAL_GROWTH_RATE, 1.0, out=strength)
+        np.minimum(CANAL_MAX_WIDTH, width + strength * CANAL_WIDTH_GROWTH, out=width)
+        alpha = np.minimum(CANAL_MAX_ALPHA, CANAL_MIN_ALPHA + (strength * 100).astype(int))
+        left = (self.canal_x[:n] - width/2).astype(int)
+        rect_w = width.astype(int)
+        changed = np.flatnonzero((left != self.canal_left[:n]) |
+                                 (rect_w != self.canal_rect_w[:n]) |
+                                 (alpha != self.canal_alpha[:n]))
+        old_rects = [self.canal_rect(i) for i in changed.tolist()]
+        self.canal_alpha[:n], self.canal_left[:n], self.canal_rect_w[:n] = alpha, left, rect_w
+        self.dirty_canal_rects.extend(rect.union(self.canal_rect(i))
+                                      for rect, i in zip(old_rects, changed.tolist()))
+
+    def repaint_background(self, dirty_rects):
+        # Merge the changed canal areas per grid cell and repaint each merged area.
+        # Canals overlap and blend, so they are re-blitted in creation (index) order
+        areas = {}
+        for rect in dirty_rects:
+            cell = (rect.centerx // CANAL_RANGE, rect.centery // CANAL_RANGE)
+            area = areas.get(cell)
+            areas[cell] = rect if area is None else area.union(rect)
+
+        for area in areas.values():
+            ids = np.array(self.nearby_canals([area.centerx], [area.centery]), dtype=int)
+            left, top = self.canal_left[ids], self.canal_y[ids].astype(int)
+            hits = ids[(left < area.right) & (left + self.canal_rect_w[ids] > area.left) &
+                       (top < area.bottom) & (top + CANAL_LENGTH*2 > area.top)]
+            self.background.set_clip(area)
+            self.background.fill((0, 0, 0))
+            self.background.blits(self.canal_blits(np.sort(hits)), doreturn=False)
+        self.background.set_clip(None)
+        return list(areas.values())
+
     def draw(self):
-        self.screen.fill((0, 0, 0))
-        
-        # Draw canals first
-        for canal in self.canals:
-            canal.draw(self.screen)
-        
-        # Create font for mass display only if needed
-        font = pygame.font.SysFont('Arial', 10) if self.show_text else None
+        if self.full_redraw:
+            self.background = pygame.Surface((self.width, self.height))
+            self.background.fill((0, 0, 0))
+            self.background.blits(self.canal_blits(np.arange(self.n_canals)), doreturn=False)
+            self.background_texture = Texture(self.renderer, (self.width, self.height),
+                                              streaming=True)
+            self.background_texture.blend_mode = 0  # Opaque, no blending needed
+            self.background_texture.update(self.background)
+            self.full_redraw = False
+        else:
+            # Upload only the repainted canal areas
+            bounds = self.background.get_rect()
+            for area in self.repaint_background(self.dirty_canal_rects):
+                area = area.clip(bounds)
+                if area.width and area.height:
+                    self.background_texture.update(self.background.subsurface(area), area)
+        self.dirty_canal_rects = []
+
+        # Compose the frame on the GPU: canal background, then drop textures
+        self.renderer.clear()
+        self.background_texture.draw()
         
-        # Draw droplets
-        for droplet in self.droplets:
-            # Main drop body
-            pos = (int(droplet.x), int(droplet.y))
-            alpha = max(100, 255 - int((droplet.mass / DROP_CRITICAL_MASS) * 100))
-            drop_surface = pygame.Surface((droplet.radius*2, droplet.radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(drop_surface, (100, 150, 255, alpha), 
-                             (droplet.radius, droplet.radius), droplet.radius)
-            self.screen.blit(drop_surface, 
-                           (pos[0]-droplet.radius, pos[1]-droplet.radius))
+        idx = self.alive_indices
+        for x, y, mass, radius in zip(self.px[idx].tolist(), self.py[idx].tolist(),
+                                      self.mass[idx].tolist(), self.radius[idx].tolist()):
+            # Main drop body, alpha quantized to multiples of 32 so only a few
+            # textures per radius exist; a step of 32 is hard to tell apart
+            pos = (int(x), int(y))
+            alpha = max(100, 255 - int((mass / DROP_CRITICAL_MASS) * 100)) & ~0x1F
+            drop_texture = self._drop_cache.get((radius, alpha))
+            if drop_texture is None:
+                drop_surface = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+                pygame.draw.circle(drop_surface, (100, 150, 255, alpha),
+                                 (radius, radius), radius)
+                drop_texture = Texture.from_surface(self.renderer, drop_surface)
+                self._drop_cache[(radius, alpha)] = drop_texture
+            drop_texture.draw(dstrect=(pos[0]-radius, pos[1]-radius, radius*2, radius*2))
             
             # Highlight
-            highlight_pos = (int(droplet.x - droplet.radius/3), 
-                           int(droplet.y - droplet.radius/3))
-            highlight_size = max(2, droplet.radius//3)
-            highlight_surface = pygame.Surface((highlight_size*2, highlight_size*2), 
-                                            pygame.SRCALPHA)
-            pygame.draw.circle(highlight_surface, (200, 225, 255, 180),
-                             (highlight_size, highlight_size), highlight_size)
-            self.screen.blit(highlight_surface, 
-                           (highlight_pos[0]-highlight_size, 
-                            highlight_pos[1]-highlight_size))
+            highlight_pos = (int(x - radius/3), 
+                           int(y - radius/3))
+            highlight_size = max(2, radius//3)
+            highlight_texture = self._highlight_cache.get(highlight_size)
+            if highlight_texture is None:
+                highlight_surface = pygame.Surface((highlight_size*2, highlight_size*2),
+                                                pygame.SRCALPHA)
+                pygame.draw.circle(highlight_surface, (200, 225, 255, 180),
+                                 (highlight_size, highlight_size), highlight_size)
+                highlight_texture = Texture.from_surface(self.renderer, highlight_surface)
+                self._highlight_cache[highlight_size] = highlight_texture
+            highlight_texture.draw(dstrect=(highlight_pos[0]-highlight_size,
+                                            highlight_pos[1]-highlight_size,
+                                            highlight_size*2, highlight_size*2))
             
             # Draw mass number if text display is enabled
             if self.show_text:
-                mass_text = font.render(f'{droplet.mass:.1f}', True, (255, 255, 255))
-                text_pos = (int(droplet.x - mass_text.get_width()/2),
-                           int(droplet.y - droplet.radius - 12))
-                self.screen.blit(mass_text, text_pos)
+                mass_text = self.render_text(f'{mass:.1f}')
+                mass_text.draw(dstrect=(int(x - mass_text.width/2), int(y - radius - 12),
+                                        mass_text.width, mass_text.height))
         
         # Draw total drop count if text display is enabled
         if self.show_text:
-            count_text = font.render(f'Drops: {len(self.droplets)}/{MAX_DROPS}', True, (255, 255, 255))
-            self.screen.blit(count_text, (10, 10))
+            count_text = self.render_text(f'Drops: {self.n_alive}/{MAX_DROPS}')
+            count_text.draw(dstrect=(10, 10, count_text.width, count_text.height))
         
-        pygame.display.flip()
+        self.renderer.present()
         
+    def render_text(self, text):
+        # Labels repeat a lot (masses are rounded), so each is rendered once
+        texture = self._text_cache.get(text)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer,
+                                           self._font.render(text, True, (255, 255, 255)))
+            self._text_cache[text] = texture
+        return texture
+
+    def nearby_canals(self, xs, ys):
+        # Canals within CANAL_RANGE of a point can only be in the 3x3 cells around it
+        cells = set()
+        for x, y in zip(xs, ys):
+            cell_x, cell_y = int(x // CANAL_RANGE), int(y // CANAL_RANGE)
+            cells.update(grid_key(cx, cy) for cx in range(cell_x - 1, cell_x + 2)
+                                          for cy in range(cell_y - 1, cell_y + 2))
+        return [i for cell in cells for i in self.canal_spatial.get(cell, ())]
+
+    def step_physics(self, dt):
+        idx = self.alive_indices
+        n = len(idx)
+        px, py, radius = self.px[idx], self.py[idx], self.radius[idx]
+
+        # Calculate gravity force component along the surface
+        gravity_force = self.gravity * _SIN_ANGLE
+
+        # Find the strongest/nearest canal for every drop at once, among the
+        # canals near any drop
+        canal_found = np.zeros(n, dtype=bool)
+        canal_x, canal_dx, canal_effect = (np.zeros(n, dtype=np.float32) for _ in range(3))
+        canal_dist2 = np.ones(n, dtype=np.float32)
+        canals = self.nearby_canals(px.tolist(), py.tolist())
+        if canals:
+            cx, cy = self.canal_x[canals], self.canal_y[canals]
+            cstrength = self.canal_strength[canals]
+            dx = cx[None, :] - px[:, None]
+            dy = cy[None, :] - py[:, None]
+            dist2 = dx*dx + dy*dy
+            # Stronger effect for stronger canals
+            effects = np.where(dist2 < _CANAL_RANGE_SQ, cstrength * (1 - dist2 / _CANAL_RANGE_SQ), 0)
+            rows, best = np.arange(n), effects.argmax(axis=1)
+            canal_effect = effects[rows, best]
+            canal_found = canal_effect > 0
+            canal_x = cx[best]
+            canal_dx = dx[rows, best]
+            canal_dist2 = np.where(canal_found, dist2[rows, best], 1)
+        is_on_canal = canal_found & (canal_dist2 < CANAL_STICK_THRESHOLD ** 2)
+        # Only the chosen canal's distance is needed, for the pull direction of
+        # drops not on it; drops on a canal (possibly at distance 0) use 1
+        canal_dist = np.sqrt(np.where(is_on_canal, 1, canal_dist2))
+
+        # Add drop-to-drop tension for all pairs at once (reduced when on canal)
+        tension_multiplier = np.where(is_on_canal, np.float32(0.2), np.float32(1.0))
+        dx = px[None, :] - px[:, None]
+        dy = py[None, :] - py[:, None]
+        dist2 = dx*dx + dy*dy
+        near = (dist2 < _TENSION_RANGE_SQ) & (dist2 > 0)
+        i, j = np.nonzero(near)
+        dist = np.sqrt(dist2[i, j])
+        size_ratio = np.minimum(radius[i], radius[j]) / np.maximum(radius[i], radius[j])
+        strength = (SURFACE_TENSION * (1 - dist2[i, j] / _TENSION_RANGE_SQ) *
+                    size_ratio * tension_multiplier[i])
+        target_dx = np.bincount(i, weights=dx[i, j] / dist * strength, minlength=n)
+        tension_dy = np.bincount(i, weights=dy[i, j] / dist * strength * 0.5, minlength=n)
+
+        mass, vx, vy = self.mass[idx], self.vx[idx], self.vy[idx]
+        active = mass >= DROP_MIN_MASS
+        # Smoother adhesion transition
+        adhesion = ADHESION_STRENGTH * (1 / (1 + (mass / CRITICAL_MASS) * 2))
+
+        # Handle canal movement: stick to the canal (allowing a slight offset)
+        # and reduce other influences, or get pulled towards it
+        px = np.where(active & is_on_canal, canal_x + canal_dx * 0.1, px)
+        target_dx = np.where(is_on_canal, target_dx * (1 - CANAL_STICK_STRENGTH), target_dx)
+        canal_pull = (canal_dx / canal_dist) * CANAL_ALIGN_STRENGTH
+        target_dx = np.where(canal_found & ~is_on_canal,
+                             target_dx + canal_pull * (1 + canal_effect),  # Stronger pull for stronger canals
+                             target_dx)
+
+        # Smooth horizontal velocity transition
+        vx = np.where(active, vx * 0.8 + target_dx * 0.2, vx)  # Faster response
+
+        # Net acceleration with smoother transition, bonus speed in canals
+        net_acceleration = gravity_force - adhesion + np.where(is_on_canal, canal_effect * 0.5, 0)
+
+        # Only move if forces overcome adhesion
+        moving = active & (net_acceleration > 0)
+        # Smoother mass-based acceleration and terminal velocity, faster in canals
+        mass_factor = np.log1p(mass / CRITICAL_MASS) + 0.5
+        max_speed = 3 * (1 + np.log1p(mass)) * np.where(is_on_canal, np.float32(1.2), np.float32(1.0))
+        vy = np.where(moving,
+                      np.minimum(vy + net_acceleration * dt * mass_factor, max_speed),
+                      vy)
+
+        # Move drop with smoothed velocities
+        self.px[idx] = np.where(moving & ~is_on_canal, px + vx * dt * 20, px)
+        self.py[idx] = np.where(moving, py + (vy + tension_dy) * dt * 15, py)
+        self.vx[idx], self.vy[idx] = vx, vy
+
     def update(self, dt):
         # Update canals
-        for canal in self.canals:
-            canal.update()
+        self.update_canals()
             
         # Only spawn new drops if below maximum
-        if len(self.droplets) < MAX_DROPS and random.random() < DROP_SPAWN_RATE:
-            center_x = random.randint(0, self.width)
+        if self.n_alive < MAX_DROPS and self._rng.random() < DROP_SPAWN_RATE:
+            center_x = self._rng.integers(0, self.width, endpoint=True)
             # Limit cluster size based on remaining space
-            max_new_drops = min(DROP_CLUSTER_SIZE[1], MAX_DROPS - len(self.droplets))
+            max_new_drops = min(DROP_CLUSTER_SIZE[1], MAX_DROPS - self.n_alive)
             if max_new_drops > 0:
-                for _ in range(random.randint(1, max_new_drops)):
-                    x = center_x + random.gauss(0, DROP_CLUSTER_SPREAD)
-                    mass = round(random.uniform(DROP_MIN_MASS, DROP_MAX_MASS), 1)
-                    droplet = WaterDroplet(x, 0, mass)
-                    droplet.simulation = self
-                    self.droplets.append(droplet)
+                # Draw the whole cluster at once
+                n = self._rng.integers(1, max_new_drops, endpoint=True)
+                xs = center_x + self._rng.normal(0, DROP_CLUSTER_SPREAD, n)
+                masses = np.round(self._rng.uniform(DROP_MIN_MASS, DROP_MAX_MASS, n), 1)
+                self.add_droplets(xs, masses)
         
         # Update drops and create canals
-        for drop in self.droplets:
-            if drop.update(self.gravity, dt, self.canals):
-                if drop.velocity > 1:
-                    self.add_canal(drop.x, drop.y, drop.radius)
+        self.step_physics(dt)
+        idx = self.alive_indices
+        moving = idx[(self.mass[idx] >= DROP_MIN_MASS) & (self.vy[idx] > 1)]
+        for x, y, r in zip(self.px[moving].tolist(), self.py[moving].tolist(),
+                           self.radius[moving].tolist()):
+            self.add_canal(x, y, r)
                     
         self.merge_droplets()
         
-        # Remove off-screen drops
-        self.droplets = [d for d in self.droplets if d.y < self.height and not d.merged]
+        # Free the slots of off-screen drops
+        self.alive &= self.py < self.height
+        self.alive_indices = np.flatnonzero(self.alive)
 
     def merge_droplets(self):
-        for i, drop1 in enumerate(self.droplets):
-            if drop1.merged:
+        # Find all colliding pairs at once, using the larger merge radius of each pair
+        idx = self.alive_indices
+        px, py = self.px[idx], self.py[idx]
+        dx = px[:, None] - px[None, :]
+        dy = py[:, None] - py[None, :]
+        radius = merge_radius(self.radius[idx])
+        threshold = np.maximum(radius[:, None], radius[None, :])
+        pairs = np.argwhere(np.triu(dx*dx + dy*dy < threshold * threshold, 1))
+        if len(pairs) == 0:
+            return
+
+        mass, vy = self.mass[idx].tolist(), self.vy[idx].tolist()
+        merged = [False] * len(idx)
+        grown = []
+        for i, j in pairs.tolist():
+            if merged[i] or merged[j]:
                 continue
-            for j, drop2 in enumerate(self.droplets[i+1:], i+1):
-                if drop2.merged:
-                    continue
-                    
-                dx = drop1.x - drop2.x
-                dy = drop1.y - drop2.y
-                distance = math.sqrt(dx*dx + dy*dy)
+
+            # Determine which drop is bigger
+            if mass[i] >= mass[j]:
+                primary, secondary = i, j
+            else:
+                primary, secondary = j, i
                 
-                # Use larger merge radius for bigger drops
-                merge_threshold = max(drop1.get_merge_radius(), drop2.get_merge_radius())
-                if distance < merge_threshold:
-                    # Determine which drop is bigger
-                    if drop1.mass >= drop2.mass:
-                        primary, secondary = drop1, drop2
-                    else:
-                        primary, secondary = drop2, drop1
-                        
-                    # Merge into the bigger drop
-                    new_mass = primary.mass + secondary.mass
-                    primary.mass = min(new_mass, DROP_CRITICAL_MASS * 1.5)
-                    # Update radius based on new mass
-                    primary.update_radius()
-                    # Bigger drops maintain more of their velocity
-                    mass_ratio = primary.mass / (primary.mass + secondary.mass)
-                    primary.velocity = (primary.velocity * mass_ratio + 
-                                      secondary.velocity * (1 - mass_ratio))
-                    secondary.merged = True
-                    
-        self.droplets = [d for d in self.droplets if not d.merged]
+            # Merge into the bigger drop
+            new_mass = mass[primary] + mass[secondary]
+            mass[primary] = min(new_mass, DROP_CRITICAL_MASS * 1.5)
+            grown.append(primary)
+            # Bigger drops maintain more of their velocity
+            mass_ratio = mass[primary] / (mass[primary] + mass[secondary])
+            vy[primary] = (vy[primary] * mass_ratio +
+                           vy[secondary] * (1 - mass_ratio))
+            merged[secondary] = True
+
+        self.mass[idx], self.vy[idx] = mass, vy
+        # Update radius based on new mass
+        grown = idx[grown]
+        self.radius[grown] = droplet_radius(self.mass[grown])
+        self.alive[idx[merged]] = False
+        self.alive_indices = np.flatnonzero(self.alive)
 
     def run(self):
         clock = pygame.time.Clock()
@@ -352,11 +493,14 @@ class RainScreensaver:
             screen_info = pygame.display.Info()
             self.width = screen_info.current_w
             self.height = screen_info.current_h
-            self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
+            self.window.size = (self.width, self.height)
+            self.window.set_fullscreen()
         else:
             self.width = self.window_width
             self.height = self.window_height
-            self.screen = pygame.display.set_mode((self.width, self.height))
+            self.window.set_windowed()
+            self.window.size = (self.width, self.height)
+        self.full_redraw = True
 
 if __name__ == "__main__":
     screensaver = RainScreensaver()
@@ -1,7 +1,7 @@
 import pygame
-import random
 import math
 import numpy as np
+from dataclasses import dataclass, fields
 
 # =============================================================================
 # CONFIGURATION - Adjust these parameters to modify the simulation
@@ -27,252 +27,291 @@ CANAL_ALPHA = 20          # Base canal visibility (0-255)
 CANAL_DECAY_RATE = 0.05  # How fast canals fade
 CANAL_STRENGTH_INCREASE = 0.5  # How much each drop adds to canal strength
 MAX_CANALS = 50           # Maximum number of canals
+CANAL_MAX_POINTS = 50     # Trail points kept per canal
+CANAL_BANDS = 4           # Polylines per canal for the fading gradient
+CANAL_COLOR = (100, 150, 255)
 
 # Canal Influence on Drops
 CANAL_RANGE = 20          # How far canals affect drops
 CANAL_PULL_STRENGTH = 0.15  # How strongly canals pull drops
 CANAL_SPEED_FACTOR = 0.2   # How much canals affect drop speed
 
-class Canal:
-    def __init__(self, x, y, direction=90):
-        self.x = x
-        self.y = y
-        self.width = 1.0
-        self.strength = 0.3
-        self.decay_rate = CANAL_DECAY_RATE
-        self.alpha = CANAL_ALPHA
-        self.direction = direction
-        self.points = [(x, y)]
-        self.max_points = 50
-        
-    def add_point(self, x, y):
-        self.points.append((x, y))
-        if len(self.points) > self.max_points:
-            self.points.pop(0)
-        # Update direction based on recent movement
-        if len(self.points) >= 2:
-            dx = self.points[-1][0] - self.points[-2][0]
-            dy = self.points[-1][1] - self.points[-2][1]
-            self.direction = math.degrees(math.atan2(dy, dx))
-            
+# Drop colors, darker inside a canal; highlights are 50 lighter per channel
+DROP_COLORS = {False: (100, 150, 255), True: (50, 100, 255)}
+
+# Drop spreading
+SPREAD_THRESHOLD = 8       # Size threshold where drops start to spread
+MAX_SPREAD_RATIO = 2.0     # Maximum diameter increase when spreading
+
+# Sine lookup table for the drop movement oscillators
+_SIN_LUT_SIZE = 4096
+_SIN_LUT = np.sin(np.linspace(0, 2*np.pi, _SIN_LUT_SIZE, endpoint=False)).astype(np.float32)
+
+class ArrayState:
+    # Base for dataclasses holding one array per property with an entry per item.
+    # Each array is a view of the first len(self) rows of a buffer that is kept
+    # across compact() and extend(), so fields must be updated in place.
+    def __post_init__(self):
+        self._buffers = {}
+
+    def __len__(self):
+        return len(getattr(self, fields(self)[0].name))
+
+    def _buffer(self, name, size):
+        # The buffer behind a field, doubled when it can't hold size items
+        items = getattr(self, name)
+        buffer = self._buffers.get(name)
+        if buffer is None or items.base is not buffer or len(buffer) < size:
+            buffer = np.empty((max(size, 2 * len(items)),) + items.shape[1:], items.dtype)
+            buffer[:len(items)] = items
+            self._buffers[name] = buffer
+        return buffer
+
+    def compact(self, keep):
+        # Keep only the items selected by a boolean mask or index array,
+        # shifting them to the front of each buffer
+        for field in fields(self):
+            kept = getattr(self, field.name)[keep]
+            buffer = self._buffer(field.name, len(kept))
+            buffer[:len(kept)] = kept
+            setattr(self, field.name, buffer[:len(kept)])
+
+    def extend(self, other):
+        n, m = len(self), len(other)
+        for field in fields(self):
+            buffer = self._buffer(field.name, n + m)
+            buffer[n:n + m] = getattr(other, field.name)
+            setattr(self, field.name, buffer[:n + m])
+
+@dataclass
+class CanalState(ArrayState):
+    # Canal properties, one array per property with an entry per canal
+    x: np.ndarray
+    y: np.ndarray
+    width: np.ndarray
+    strength: np.ndarray
+    alpha: np.ndarray
+    points: np.ndarray            # Trail points, a ring of CANAL_MAX_POINTS per canal
+    total: np.ndarray             # Points ever added; the newest is at (total - 1) % CANAL_MAX_POINTS
+
+    @classmethod
+    def create(cls, x, y):
+        n = len(x)
+        points = np.zeros((n, CANAL_MAX_POINTS, 2), dtype=np.float32)
+        points[:, 0, 0], points[:, 0, 1] = x, y
+        return cls(
+            x=np.asarray(x, dtype=np.float32),
+            y=np.asarray(y, dtype=np.float32),
+            width=np.ones(n, dtype=np.float32),
+            strength=np.full(n, 0.3, dtype=np.float32),
+            alpha=np.full(n, CANAL_ALPHA),
+            points=points,
+            total=np.ones(n, dtype=int),
+        )
+
+    def add_points(self, ids, ranks, x, y):
+        # Append trail points; ranks number each canal's new points from 0 in order,
+        # and the oldest points are overwritten once a canal's ring is full
+        slots = (self.total[ids] + ranks) % CANAL_MAX_POINTS
+        self.points[ids, slots, 0] = x
+        self.points[ids, slots, 1] = y
+        touched, added = np.unique(ids, return_counts=True)
+        self.total[touched] += added
+
+    def trail(self, i):
+        # Canal i's points, oldest first
+        count = min(self.total[i], CANAL_MAX_POINTS)
+        return self.points[i, (self.total[i] - count + np.arange(count)) % CANAL_MAX_POINTS]
+
     def update(self):
-        self.strength *= (1 - self.decay_rate)
-        self.alpha = min(128, int(CANAL_ALPHA + self.strength * 100))
-        return self.strength > 0.1
+        # Fade all canals and drop the ones that faded out
+        self.strength *= (1 - CANAL_DECAY_RATE)
+        self.alpha[:] = np.minimum(128, (CANAL_ALPHA + self.strength * 100).astype(int))
+        self.compact(self.strength > 0.1)
 
-    def draw(self, screen):
-        if len(self.points) < 2:
-            return
-            
-        # Draw canal path with gradient
-        for i in range(len(self.points) - 1):
-            start = self.points[i]
-            end = self.points[i + 1]
-            
-            # Calculate progress along the canal
-            progress = i / len(self.points)
-            
-            # Vary width and alpha based on progress and strength
-            local_width = self.width * (1 - progress * 0.3)
-            alpha = min(255, max(0, int(self.strength * 128 * (1 - progress * 0.3))))
-            
-            # Draw line segment with transparency
-            surf = pygame.Surface((int(local_width * 2), 2), pygame.SRCALPHA)
-            surf.fill((100, 150, 255, alpha))
-            
-            # Calculate angle for proper rotation
-            dx = end[0] - start[0]
-            dy = end[1] - start[1]
-            angle = math.degrees(math.atan2(dy, dx))
-            
-            # Rotate and position the surface
-            rotated = pygame.transform.rotate(surf, -angle)
-            pos = (int(start[0] - rotated.get_width()/2),
-                  int(start[1] - rotated.get_height()/2))
-            screen.blit(rotated, pos)
-
-class Raindrop:
-    def __init__(self, x, y, size):
-        self.x = x
-        self.y = y
-        self.base_size = size  # Original diameter in pixels
-        self.size = size  # Current visible diameter
-        
-        # Spreading parameters (moved up)
-        self.spread_threshold = 8  # Size threshold where drops start to spread
-        self.max_spread_ratio = 2.0  # Maximum diameter increase when spreading
-        
-        # Physical properties based on the paper
-        self.volume = (math.pi * (size/2)**3) / 6  # Volume following
-        self.mass = self.volume * 0.001  # Mass proportional to volume
-        self.adhesion_force = self.calculate_adhesion()  # Now spread_threshold is defined
-        
-        # Movement properties
-        self.velocity_x = 0
-        self.velocity_y = 0
-        self.angle = 90
-        
-        # State properties
-        self.is_stuck = True
-        self.in_canal = False
-        self.canal_influence = 0.8
-        
-        # Add merge properties
-        self.merge_radius = size * 0.7  # Radius for merge detection
-        self.near_canal = False  # New flag to track canal proximity
-        self.to_remove = False  # Flag for drops that should be removed after merging
-        
-        # New surface tension properties
-        self.stretch = 0.0
-        self.wobble = 0.0
-        self.wobble_direction = 1
-        self.surface_tension = SURFACE_TENSION
-        self.dx = 0  # Horizontal velocity
-        self.movement_timer = random.random() * 6.28
-        self.momentum = MOMENTUM_FACTOR
-
-    def calculate_adhesion(self):
-        # Adhesion force proportional to diameter for small drops
-        if self.size < self.spread_threshold:
-            return self.size * 0.05
-        else:
-            # Reduced adhesion for larger drops that tend to spread
-            return (self.spread_threshold * 0.05) * (self.spread_threshold / self.size)
-    
-    def update_size(self):
-        # Update drop diameter based on vertical velocity (spreading effect)
-        if self.size > self.spread_threshold:
-            spread_factor = min(abs(self.velocity_y) * 0.1, self.max_spread_ratio)
-            self.size = self.base_size * (1 + spread_factor)
-        else:
-            self.size = self.base_size
-            
-    def find_nearest_canal(self, canals, max_distance=20):
-        nearest = None
-        min_dist = max_distance
-        
-        for canal in canals:
-            dist = math.sqrt((self.x - canal.x)**2 + (self.y - canal.y)**2)
-            if dist < min_dist:
-                min_dist = dist
-                nearest = canal
-                
-        return nearest, min_dist
+@dataclass
+class DropState(ArrayState):
+    # Drop properties, one array per property with an entry per drop
+    x: np.ndarray
+    y: np.ndarray
+    velocity_x: np.ndarray
+    velocity_y: np.ndarray
+    dx: np.ndarray                # Horizontal velocity
+    size: np.ndarray              # Current visible diameter
+    base_size: np.ndarray         # Original diameter in pixels
+    stretch: np.ndarray
+    wobble: np.ndarray
+    wobble_direction: np.ndarray
+    movement_timer: np.ndarray
+    is_stuck: np.ndarray
+    in_canal: np.ndarray
+    near_canal: np.ndarray        # Tracks canal proximity
+    to_remove: np.ndarray         # Drops that should be removed after merging
 
-    def update(self, wind_speed, canals, gravity=9.81):
-        if not self.is_stuck:
-            self.movement_timer += 0.03
-            
-            # Use configuration parameters for movement
-            random_force = math.sin(self.movement_timer) * RANDOM_MOVEMENT
-            wind_effect = wind_speed * WIND_EFFECT * (1 + 0.1 * math.sin(self.movement_timer * 0.5))
-            
-            # Momentum-based movement
-            self.dx = self.dx * MOMENTUM_FACTOR + (random_force + wind_effect) * 0.2
-            
-            nearest_canal, distance = self.find_nearest_canal(canals, CANAL_RANGE)
-            self.near_canal = distance < CANAL_RANGE * 1.5
-            
-            if nearest_canal and distance < CANAL_RANGE:
-                if not self.in_canal:
-                    self.velocity_y *= 0.3
-                    self.dx *= 0.3
-                
-                nearest_canal.strength = min(1.0, nearest_canal.strength + CANAL_STRENGTH_INCREASE)
-                nearest_canal.width = min(CANAL_MAX_WIDTH, nearest_canal.width + 0.01)
-                nearest_canal.add_point(self.x, self.y)
-                
-                pull_strength = CANAL_PULL_STRENGTH * (1 - self.surface_tension * 0.5)
-                dx = nearest_canal.x - self.x
-                self.x += dx * pull_strength
-                
-                target_vel_y = 1.0 * (1 + self.size * CANAL_SPEED_FACTOR) * nearest_canal.strength
-                self.velocity_y += (target_vel_y - self.velocity_y) * 0.05
-                
-                self.in_canal = True
-                
-                if random.random() < 0.01 * SURFACE_TENSION:
-                    self.velocity_y *= 0.1
-                    self.dx *= 0.1
-            else:
-                gravity_force = self.mass * gravity
-                tension_factor = max(0.2, 1.0 - SURFACE_TENSION * (1 - self.size/10))
-                self.velocity_y += gravity_force * BASE_GRAVITY * tension_factor
-                
-                # Create new canal if moving fast enough
-                total_velocity = math.sqrt(self.velocity_y**2 + self.dx**2)
-                canal_chance = min(0.05, total_velocity * self.size * 0.0005)
-                
-                if random.random() < canal_chance:
-                    direction = math.degrees(math.atan2(self.velocity_y, self.dx))
-                    new_canal = Canal(self.x, self.y, direction)
-                    canals.append(new_canal)
-                
-                self.in_canal = False
-            
-            # Update position with more gradual movement
-            self.x += self.dx
-            self.y += self.velocity_y * 0.7  # Reduced overall vertical speed
-            
-            # Update visual effects
-            self.update_size()
-            total_velocity = math.sqrt(self.dx**2 + self.velocity_y**2)
-            self.stretch = min(0.5, total_velocity * 0.08)
-            
-            # Update wobble
-            self.wobble += 0.08 * self.wobble_direction  # Slower wobble
-            if abs(self.wobble) > 0.4:
-                self.wobble_direction *= -1
-        else:
-            total_force = math.sqrt((wind_speed**2 + gravity**2))
-            if total_force > self.adhesion_force * 0.5:
-                self.is_stuck = False
-
-    def merge_with(self, other_drop):
-        # Combine volumes
-        total_volume = self.volume + other_drop.volume
-        
-        # New diameter based on Ω ∝ D³ relationship
-        new_size = 2 * ((6 * total_volume / math.pi) ** (1/3))
-        
-        # Average position weighted by volume
-        self.x = (self.x * self.volume + other_drop.x * other_drop.volume) / total_volume
-        self.y = (self.y * self.volume + other_drop.y * other_drop.volume) / total_volume
-        
-        # Average velocities weighted by mass
-        self.velocity_x = (self.velocity_x * self.mass + other_drop.velocity_x * other_drop.mass) / (self.mass + other_drop.mass)
-        self.velocity_y = (self.velocity_y * self.mass + other_drop.velocity_y * other_drop.mass) / (self.mass + other_drop.mass)
-        
-        # Update properties
-        self.base_size = new_size
-        self.size = new_size
-        self.volume = total_volume
-        self.mass = total_volume * 0.001
-        self.merge_radius = new_size * 0.7
-        
-        # Mark other drop for removal
-        other_drop.to_remove = True
-        
-        # Increase canal influence for larger drops
-        self.canal_influence = min(0.9, self.canal_influence + 0.1)
+    @classmethod
+    def create(cls, x, y, size, movement_timer):
+        n = len(size)
+        size = np.asarray(size, dtype=np.float32)
+        return cls(
+            x=np.asarray(x, dtype=np.float32),
+            y=np.asarray(y, dtype=np.float32),
+            velocity_x=np.zeros(n, dtype=np.float32),
+            velocity_y=np.zeros(n, dtype=np.float32),
+            dx=np.zeros(n, dtype=np.float32),
+            size=size,
+            base_size=size.copy(),
+            stretch=np.zeros(n, dtype=np.float32),
+            wobble=np.zeros(n, dtype=np.float32),
+            wobble_direction=np.ones(n, dtype=np.float32),
+            movement_timer=np.asarray(movement_timer, dtype=np.float32),
+            is_stuck=np.ones(n, dtype=bool),
+            in_canal=np.zeros(n, dtype=bool),
+            near_canal=np.zeros(n, dtype=bool),
+            to_remove=np.zeros(n, dtype=bool),
+        )
 
-    def draw(self, screen):
-        # Calculate drop shape based on surface tension
-        width = int(self.size * (1 - self.stretch * 0.3))
-        height = int(self.size * (1 + self.stretch * 0.5))
-        
-        # Draw deformed drop
-        color = (50, 100, 255) if self.in_canal else (100, 150, 255)
-        pygame.draw.ellipse(screen, color,
-                          (int(self.x - width/2), int(self.y - height/2),
-                           width, height))
+def lut_sin(phase):
+    # Table sine for non-negative phases; the movement timers only grow
+    index = (phase * (_SIN_LUT_SIZE / (2*np.pi))).astype(np.int32) & (_SIN_LUT_SIZE - 1)
+    return _SIN_LUT[index]
+
+def calculate_volume(size):
+    # Volume following Ω ∝ D³ from the paper. Volume, mass (volume * 0.001),
+    # adhesion and merge radius (size * 0.7) all derive from a drop's base size
+    return np.pi * (size*size*size*0.125) / 6
+
+def calculate_adhesion(size):
+    # Adhesion force proportional to diameter for small drops,
+    # reduced for larger drops that tend to spread
+    return np.where(size < SPREAD_THRESHOLD, size * 0.05,
+                    (SPREAD_THRESHOLD * 0.05) * (SPREAD_THRESHOLD / size)).astype(np.float32)
+
+def close_pairs(x, y, radius):
+    # All pairs (i, j), i < j, closer than radius, sorted by i then j. Drops are
+    # swept in x order and only those within radius along x are compared
+    order = np.argsort(x, kind='stable')
+    sorted_x = x[order]
+    start = np.arange(1, len(x) + 1)
+    counts = np.searchsorted(sorted_x, sorted_x + radius, side='right') - start
+    counts = np.maximum(counts, 0)
+    a = np.repeat(np.arange(len(x)), counts)
+    b = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(start, counts)
+    i, j = order[a], order[b]
+    close = (x[i] - x[j])**2 + (y[i] - y[j])**2 < radius * radius
+    i, j = np.minimum(i[close], j[close]), np.maximum(i[close], j[close])
+    pairs = np.lexsort((j, i))
+    return i[pairs], j[pairs]
+
+def update_drops(drops, wind_speed, canals, rng, gravity=9.81):
+    # Advance every drop by one frame. Canals touched by drops are strengthened
+    # and new canals started by fast drops are appended to canals
+    # Only drops that were moving at the start of the frame are updated. They are
+    # gathered out of the arrays, or sliced when none are stuck to avoid copying
+    stuck = drops.is_stuck
+    any_stuck = stuck.any()
+    active = np.flatnonzero(~stuck) if any_stuck else slice(None)
+    
+    # Stuck drops only check whether wind and gravity overcome adhesion
+    total_force = math.sqrt((wind_speed**2 + gravity**2))
+    if any_stuck:
+        stuck[stuck] = ~(total_force > calculate_adhesion(drops.base_size[stuck]) * 0.5)
+    
+    x, y, size, vy = drops.x[active], drops.y[active], drops.size[active], drops.velocity_y[active]
+    base_size = drops.base_size[active]
+    n = len(x)
+    # One roll per drop for each random event this frame
+    kick_roll, spawn_roll = rng.random((2, n), dtype=np.float32)
+    timer = drops.movement_timer[active] + 0.03
+    
+    # Use configuration parameters for movement
+    random_force = lut_sin(timer) * RANDOM_MOVEMENT
+    wind_effect = wind_speed * WIND_EFFECT * (1 + 0.1 * lut_sin(timer * 0.5))
+    
+    # Momentum-based movement
+    dx = drops.dx[active] * MOMENTUM_FACTOR + (random_force + wind_effect) * 0.2
+    
+    # Nearest canal within CANAL_RANGE of every drop, compared by squared distance
+    nearest = np.full(n, -1)
+    distance2 = np.full(n, CANAL_RANGE * CANAL_RANGE, dtype=np.float32)
+    canal_x = np.zeros(n, dtype=np.float32)
+    if len(canals):
+        cx, cy = canals.x, canals.y
+        dist2 = (x[:, None] - cx[None, :])**2 + (y[:, None] - cy[None, :])**2
+        best = dist2.argmin(axis=1)
+        best_dist2 = dist2[np.arange(n), best]
+        found = best_dist2 < CANAL_RANGE * CANAL_RANGE
+        nearest = np.where(found, best, -1)
+        distance2 = np.where(found, best_dist2, distance2)
+        canal_x = cx[best]
+    near_canal = distance2 < (CANAL_RANGE * 1.5)**2
+    in_range = nearest >= 0
+    
+    # Drops feed the canal they are in. Drops are grouped per canal (keeping
+    # drop order), and each drop sees the strength left by the drops before it
+    canal_strength = np.zeros(n, dtype=np.float32)
+    hits = np.flatnonzero(in_range)
+    if len(hits):
+        hit_canal = nearest[hits]
+        order = np.argsort(hit_canal, kind='stable')
+        grouped = hit_canal[order]
+        rank = np.empty(len(hits), dtype=int)
+        rank[order] = np.arange(len(hits)) - np.searchsorted(grouped, grouped)
+        canal_strength[hits] = np.minimum(
+            1.0, canals.strength[hit_canal] + CANAL_STRENGTH_INCREASE * (rank + 1))
         
-        # Add highlight for surface tension effect
-        highlight_size = max(1, int(width * 0.3))
-        highlight_color = tuple(min(255, c + 50) for c in color)
-        pygame.draw.ellipse(screen, highlight_color,
-                          (int(self.x - width/4), int(self.y - height/4),
-                           highlight_size, highlight_size))
+        ids, counts = np.unique(grouped, return_counts=True)
+        canals.strength[ids] = np.minimum(1.0, canals.strength[ids] + CANAL_STRENGTH_INCREASE * counts)
+        canals.width[ids] = np.minimum(CANAL_MAX_WIDTH, canals.width[ids] + 0.01 * counts)
+        canals.add_points(grouped, rank[order], x[hits[order]], y[hits[order]])
+    
+    # Drops entering a canal slow down
+    entering = in_range & ~drops.in_canal[active]
+    vy = np.where(entering, vy * 0.3, vy)
+    dx = np.where(entering, dx * 0.3, dx)
+    
+    pull_strength = CANAL_PULL_STRENGTH * (1 - SURFACE_TENSION * 0.5)
+    x = np.where(in_range, x + (canal_x - x) * pull_strength, x)
+    
+    target_vel_y = 1.0 * (1 + size * CANAL_SPEED_FACTOR) * canal_strength
+    vy = np.where(in_range, vy + (target_vel_y - vy) * 0.05, vy)
+    
+    kick = in_range & (kick_roll < 0.01 * SURFACE_TENSION)
+    vy = np.where(kick, vy * 0.1, vy)
+    dx = np.where(kick, dx * 0.1, dx)
+    
+    # Drops outside canals fall
+    falling = ~in_range
+    tension_factor = np.maximum(0.2, 1.0 - SURFACE_TENSION * (1 - size/10))
+    mass = calculate_volume(base_size) * 0.001
+    vy = np.where(falling, vy + mass * gravity * BASE_GRAVITY * tension_factor, vy)
+    
+    # Create new canal if moving fast enough
+    total_velocity = np.hypot(vy, dx)
+    canal_chance = np.minimum(0.05, total_velocity * size * 0.0005)
+    spawn = np.flatnonzero(falling & (spawn_roll < canal_chance))
+    canals.extend(CanalState.create(x[spawn], y[spawn]))
+    
+    # Update position with more gradual movement
+    new_x = x + dx
+    new_y = y + vy * 0.7  # Reduced overall vertical speed
+    
+    # Update drop diameter based on vertical velocity (spreading effect)
+    spread_factor = np.minimum(np.abs(vy) * 0.1, MAX_SPREAD_RATIO)
+    new_size = np.where(size > SPREAD_THRESHOLD, base_size * (1 + spread_factor), base_size)
+    stretch = np.minimum(0.5, total_velocity * 0.08)  # Velocity is unchanged since above
+    
+    # Update wobble
+    wobble_direction = drops.wobble_direction[active]
+    wobble = drops.wobble[active] + 0.08 * wobble_direction  # Slower wobble
+    wobble_direction = np.where(np.abs(wobble) > 0.4, -wobble_direction, wobble_direction)
+    
+    # Scatter the results back to the moving drops
+    drops.x[active], drops.y[active] = new_x, new_y
+    drops.dx[active], drops.velocity_y[active] = dx, vy
+    drops.movement_timer[active] = timer
+    drops.size[active], drops.stretch[active] = new_size, stretch
+    drops.wobble[active], drops.wobble_direction[active] = wobble, wobble_direction
+    drops.in_canal[active], drops.near_canal[active] = in_range, near_canal
 
 class Screensaver:
     def __init__(self, width=800, height=600):
@@ -285,68 +324,150 @@ class Screensaver:
         self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
         pygame.display.set_caption("Raindrop Screensaver")
         
-        self.drops = []
         self.wind_speed = 3.0  # Increased base wind speed
         self.running = True
         
+        self._rng = np.random.default_rng()
+        
         # Initialize drops
-        for _ in range(DROP_COUNT):
-            self.add_drop()
+        self.drops = self.new_drops(DROP_COUNT)
 
-        self.canals = []
+        self.canals = CanalState.create([], [])
         self.max_canals = MAX_CANALS
         
         self.merge_cooldown = 0  # Add cooldown to prevent excessive merging
+        
+        self._sprite_cache = {}  # (width, height, in_canal) -> drop sprite
 
-    def add_drop(self):
-        x = random.randint(0, self.width)
-        y = random.randint(0, self.height)
-        size = random.uniform(DROP_MIN_SIZE, DROP_MAX_SIZE)
-        self.drops.append(Raindrop(x, y, size))
+    def new_drops(self, n):
+        x = self._rng.integers(0, self.width, n, endpoint=True)
+        y = self._rng.integers(0, self.height, n, endpoint=True)
+        size = self._rng.uniform(DROP_MIN_SIZE, DROP_MAX_SIZE, n)
+        return DropState.create(x, y, size, self._rng.random(n, dtype=np.float32) * 6.28)
 
     def check_drop_collisions(self):
         if self.merge_cooldown > 0:
             self.merge_cooldown -= 1
             return
-            
-        for i, drop1 in enumerate(self.drops):
-            if drop1.to_remove:
+        
+        drops = self.drops
+        # Candidate pairs within the largest possible merge threshold (near canals)
+        merge_radius = drops.base_size * 0.7
+        i, j = close_pairs(drops.x, drops.y, merge_radius.max(initial=0) * 2 * 1.5)
+        
+        # Adjust merge threshold based on canal proximity
+        near = drops.near_canal[i] | drops.near_canal[j]
+        merge_threshold = (merge_radius[i] + merge_radius[j]) * np.where(near, 1.5, 1.0)
+        distance2 = (drops.x[i] - drops.x[j])**2 + (drops.y[i] - drops.y[j])**2
+        velocity_diff2 = ((drops.velocity_x[i] - drops.velocity_x[j])**2 +
+                          (drops.velocity_y[i] - drops.velocity_y[j])**2)
+        # More lenient velocity matching near canals
+        velocity_threshold = np.where(near, 4.0, 2.0)
+        mergeable = ((distance2 < merge_threshold**2) &
+                     (velocity_diff2 < velocity_threshold**2) &
+                     ~drops.to_remove[i] & ~drops.to_remove[j])
+        if not mergeable.any():
+            return
+        
+        # Resolve merges in pair order; each drop merges at most once as the first of a pair
+        x, y = drops.x.tolist(), drops.y.tolist()
+        velocity_x, velocity_y = drops.velocity_x.tolist(), drops.velocity_y.tolist()
+        volume = calculate_volume(drops.base_size).tolist()
+        size, base_size = drops.size.tolist(), drops.base_size.tolist()
+        in_canal, to_remove = drops.in_canal.tolist(), drops.to_remove.tolist()
+        last_first = -1
+        for first, second in zip(i[mergeable].tolist(), j[mergeable].tolist()):
+            if first == last_first or to_remove[first] or to_remove[second]:
                 continue
+            
+            # Prefer merging into the drop that's in a canal
+            if in_canal[first] and not in_canal[second]:
+                keep, other = first, second
+            elif in_canal[second] and not in_canal[first]:
+                keep, other = second, first
+            # Otherwise merge into the larger drop as before
+            elif volume[first] > volume[second]:
+                keep, other = first, second
+            else:
+                keep, other = second, first
+            
+            # Combine volumes, averaging position weighted by volume
+            # and velocities weighted by mass (mass is proportional to volume)
+            total_volume = volume[keep] + volume[other]
+            x[keep] = (x[keep] * volume[keep] + x[other] * volume[other]) / total_volume
+            y[keep] = (y[keep] * volume[keep] + y[other] * volume[other]) / total_volume
+            velocity_x[keep] = (velocity_x[keep] * volume[keep] +
+                                velocity_x[other] * volume[other]) / total_volume
+            velocity_y[keep] = (velocity_y[keep] * volume[keep] +
+                                velocity_y[other] * volume[other]) / total_volume
+            volume[keep] = total_volume
+            # New diameter based on Ω ∝ D³ relationship
+            new_size = 2 * ((6 * total_volume / math.pi) ** (1/3))
+            base_size[keep] = size[keep] = new_size
+            
+            # Mark other drop for removal
+            to_remove[other] = True
+            last_first = first
+        
+        drops.x[:], drops.y[:] = x, y
+        drops.velocity_x[:], drops.velocity_y[:] = velocity_x, velocity_y
+        drops.size[:], drops.base_size[:] = size, base_size
+        drops.to_remove[:] = to_remove
+        self.merge_cooldown = 5
+
+    def draw_canals(self):
+        canals = self.canals
+        # Only canals with a trail and a visible width draw anything
+        for i in np.flatnonzero((canals.total >= 2) & (canals.width * 2 >= 1)).tolist():
+            points = canals.trail(i).tolist()
+            width, strength = float(canals.width[i]), float(canals.strength[i])
+            
+            # Draw canal path as a few polylines, width and alpha fading along it.
+            # Lines are opaque, so the alpha is applied against the black background
+            bounds = np.linspace(0, len(points) - 1, CANAL_BANDS + 1).astype(int).tolist()
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                # Calculate progress along the canal
+                progress = start / len(points)
                 
-            for drop2 in self.drops[i+1:]:
-                if drop2.to_remove:
+                # Vary width and alpha based on progress and strength
+                local_width = int(width * (1 - progress * 0.3) * 2)
+                alpha = min(255, max(0, int(strength * 128 * (1 - progress * 0.3))))
+                if end == start or local_width < 1 or alpha == 0:
                     continue
-                    
-                distance = math.sqrt((drop1.x - drop2.x)**2 + (drop1.y - drop2.y)**2)
-                
-                # Adjust merge threshold based on canal proximity
-                merge_threshold = (drop1.merge_radius + drop2.merge_radius)
-                if drop1.near_canal or drop2.near_canal:
-                    merge_threshold *= 1.5  # Easier merging near canals
-                
-                if distance < merge_threshold:
-                    velocity_diff = math.sqrt(
-                        (drop1.velocity_x - drop2.velocity_x)**2 +
-                        (drop1.velocity_y - drop2.velocity_y)**2
-                    )
-                    
-                    # More lenient velocity matching near canals
-                    velocity_threshold = 4.0 if (drop1.near_canal or drop2.near_canal) else 2.0
-                    
-                    if velocity_diff < velocity_threshold:
-                        # Prefer merging into the drop that's in a canal
-                        if drop1.in_canal and not drop2.in_canal:
-                            drop1.merge_with(drop2)
-                        elif drop2.in_canal and not drop1.in_canal:
-                            drop2.merge_with(drop1)
-                        # Otherwise merge into the larger drop as before
-                        elif drop1.volume > drop2.volume:
-                            drop1.merge_with(drop2)
-                        else:
-                            drop2.merge_with(drop1)
-                        
-                        self.merge_cooldown = 5
-                        break
+                color = tuple(c * alpha // 255 for c in CANAL_COLOR)
+                pygame.draw.lines(self.screen, color, False, points[start:end + 1], local_width)
+
+    def drop_sprite(self, width, height, in_canal):
+        # Drop body with its highlight, rendered once per shape and canal state
+        key = (width, height, in_canal)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            color = DROP_COLORS[in_canal]
+            highlight_color = tuple(min(255, c + 50) for c in color)
+            sprite = pygame.Surface((width, height)).convert()
+            sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            pygame.draw.ellipse(sprite, color, (0, 0, width, height))
+            
+            # Add highlight for surface tension effect
+            highlight_size = max(1, int(width * 0.3))
+            pygame.draw.ellipse(sprite, highlight_color,
+                              (int(width/4), int(height/4), highlight_size, highlight_size))
+            self._sprite_cache[key] = sprite
+        return sprite
+
+    def draw_drops(self):
+        drops = self.drops
+        # Calculate drop shapes based on surface tension
+        width = (drops.size * (1 - drops.stretch * 0.3)).astype(int)
+        height = (drops.size * (1 + drops.stretch * 0.5)).astype(int)
+        left = (drops.x - width/2).astype(int)
+        top = (drops.y - height/2).astype(int)
+        
+        sprite = self.drop_sprite
+        self.screen.blits([(sprite(w, h, in_canal), (x, y)) for w, h, in_canal, x, y in
+                           zip(width.tolist(), height.tolist(), drops.in_canal.tolist(),
+                               left.tolist(), top.tolist())],
+                          doreturn=False)
 
     def run(self):
         clock = pygame.time.Clock()
@@ -362,32 +483,35 @@ class Screensaver:
             # Update wind speed with some variation
             self.wind_speed = 3.0 + math.sin(pygame.time.get_ticks() * 0.001) * 1.0
 
-            # Check for drop collisions and merging
-            self.check_drop_collisions()
-            
-            # Update and draw drops
             self.screen.fill((0, 0, 0))
             
             # Update and draw canals
-            self.canals = [canal for canal in self.canals if canal.update()]
-            for canal in self.canals:
-                canal.draw(self.screen)
+            self.canals.update()
+            self.draw_canals()
             
-            # Update and draw drops
-            self.drops = [drop for drop in self.drops if not drop.to_remove]
-            for drop in self.drops:
-                drop.update(self.wind_speed, self.canals)
-                drop.draw(self.screen)
-                
-                # Remove drops that go off screen and add new ones
-                if drop.y > self.height or drop.x > self.width or drop.x < 0:
-                    self.drops.remove(drop)
-                    self.add_drop()
+            # Update drops
+            update_drops(self.drops, self.wind_speed, self.canals, self._rng)
+            
+            # Drops that went off screen are replaced; they are flagged first so
+            # they take no part in merging
+            drops = self.drops
+            offscreen = (drops.y > self.height) | (drops.x > self.width) | (drops.x < 0)
+            drops.to_remove |= offscreen
+            
+            # Check for drop collisions and merging
+            self.check_drop_collisions()
+            
+            # Drop off-screen and merged drops in one pass, add replacements,
+            # then draw only the drops that are still alive
+            drops.compact(~drops.to_remove)
+            if offscreen.any():
+                drops.extend(self.new_drops(int(offscreen.sum())))
+            self.draw_drops()
 
-            # Limit number of canals
+            # Limit number of canals, keeping the strongest in their current order
             if len(self.canals) > self.max_canals:
-                self.canals.sort(key=lambda c: c.strength)
-                self.canals = self.canals[-self.max_canals:]
+                strongest = np.argpartition(self.canals.strength, -self.max_canals)[-self.max_canals:]
+                self.canals.compact(np.sort(strongest))
 
             pygame.display.flip()
             clock.tick(60)
@@ -1,7 +1,7 @@
 import pygame
-import random
 import numpy as np
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Union
 import sys
 import traceback
 import math
@@ -19,6 +19,7 @@ DROP_SPAWN_RATE = 10       # Frames between drop spawns (lower = more drops)
 DROP_CLUSTER_SIZE = (1, 3) # Min and max drops per cluster
 DROP_CLUSTER_SPREAD = 20   # How far drops spread in a cluster
 DROP_COLLISION_FACTOR = 0.7 # How easily drops merge (> 1.0 means merge before touching)
+SPATIAL_HASH_MIN_DROPS = 200 # Below this many drops, collisions are checked between all pairs
 
 # Surface Tension Settings
 SURFACE_TENSION = 0.3      # Surface tension strength (0-1)
@@ -39,6 +40,7 @@ CANAL_ALPHA = 20          # Base canal visibility (0-255)
 CANAL_GROWTH_RATE = 0.01   # How fast canals strengthen
 CANAL_WIDTH_GROWTH = 0.2   # How fast canals widen
 CANAL_STRENGTH_INCREASE = 0.5 # How much each drop adds to canal strength
+CANAL_MAX_COUNT = 2000      # Maximum number of canals (least recently fed are removed)
 
 # Canal Influence on Drops
 CANAL_RANGE_VERTICAL = 10   # How far vertically canals affect drops
@@ -59,146 +61,125 @@ class Canal:
         self.width = min(initial_width, CANAL_MAX_WIDTH)
         self.alpha = CANAL_ALPHA
 
-    def update(self):
+    def update(self) -> bool:
+        # Returns whether the canal now draws differently
+        look = (int(self.width), self.alpha)
         self.strength = min(self.strength + CANAL_GROWTH_RATE, 1.0)
         self.width = min(CANAL_MAX_WIDTH, self.width + self.strength * CANAL_WIDTH_GROWTH)
         self.alpha = min(CANAL_ALPHA + int(self.strength * 95), 255)
-
-    def draw(self, screen):
-        canal_surface = pygame.Surface((int(self.width), 2), pygame.SRCALPHA)  # Thinner canals
-        canal_surface.fill((150, 150, 255, self.alpha))
-        screen.blit(canal_surface, (int(self.x - self.width/2), int(self.y)))
-
-class Drop:
-    def __init__(self, x: float, y: float, size: float = 2.0):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.speed = 1 + size * DROP_SPEED_FACTOR
-        self.velocity = self.speed
-        self.alive = True
+        return (int(self.width), self.alpha) != look
+
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(int(self.x - self.width/2), int(self.y), int(self.width), 2)
+
+class DropPool:
+    # Drops stored as parallel arrays, one column per property; the first n
+    # entries of every column are the live drops
+    COLUMNS = ('x', 'y', 'size', 'speed', 'velocity', 'alive', 'stretch', 'wobble',
+               'dx', 'movement_timer')
+
+    def __init__(self, rng: np.random.Generator, capacity: int = 64):
+        self.rng = rng
+        self.n = 0
+        for name in self.COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=bool if name == 'alive' else np.float32))
+
+    def add(self, x: Union[float, np.ndarray], y: Union[float, np.ndarray],
+            size: Union[float, np.ndarray] = 2.0) -> slice:
+        # Append one drop or an array of drops; returns the slice they occupy
+        size = np.atleast_1d(np.asarray(size, dtype=np.float32))
+        count = len(size)
+        capacity = len(self.x)
+        if self.n + count > capacity:
+            # Double the capacity of every column until the new drops fit
+            while self.n + count > capacity:
+                capacity *= 2
+            for name in self.COLUMNS:
+                setattr(self, name, np.resize(getattr(self, name), capacity))
+        new = slice(self.n, self.n + count)
+        self.x[new] = x
+        self.y[new] = y
+        self.size[new] = size
+        self.speed[new] = self.velocity[new] = 1 + size * DROP_SPEED_FACTOR
+        self.alive[new] = True
         # Surface tension properties
-        self.stretch = 0.0
-        self.wobble = 0.0
-        self.wobble_direction = 1
-        self.surface_energy = size * SURFACE_TENSION
+        self.stretch[new] = 0.0
+        self.wobble[new] = 0.0
         # Movement properties
-        self.dx = 0  # Horizontal velocity
-        self.movement_timer = random.random() * 6.28  # Random starting phase
-
-    def update(self, height: int, canals: List[Canal]):
-        # Update movement timer
-        self.movement_timer += 0.05
-        
-        # Random sideways movement
-        random_force = math.sin(self.movement_timer) * RANDOM_MOVEMENT
-        wind = WIND_EFFECT * (1 + 0.2 * math.sin(self.movement_timer * 0.5))
-        
-        # Update horizontal velocity with momentum
-        self.dx = self.dx * MOMENTUM_FACTOR + (random_force + wind) * 0.2
-        self.x += self.dx
-        
-        # Base velocity
-        if self.y > height * SPEED_TRANSITION_HEIGHT:
-            progress = (self.y - height * SPEED_TRANSITION_HEIGHT) / (height * (1 - SPEED_TRANSITION_HEIGHT))
-            target_velocity = self.speed * (1 + progress * BOTTOM_SPEED_MULTIPLIER)
-        else:
-            target_velocity = self.speed
-
-        # Surface tension affects acceleration
-        tension_factor = 1.0 - (self.stretch * SURFACE_TENSION)
-        self.velocity += (target_velocity - self.velocity) * 0.1 * tension_factor
-        
-        # Update stretch based on total movement (vertical and horizontal)
-        total_velocity = math.sqrt(self.velocity**2 + self.dx**2)
-        target_stretch = (total_velocity / self.speed - 1) * (1 - TENSION_ROUNDNESS)
-        self.stretch += (target_stretch - self.stretch) * 0.1
-        
-        # Limit stretch and check for breaking
-        self.stretch = min(self.stretch, TENSION_BREAK_POINT)
-        if self.stretch >= TENSION_BREAK_POINT and self.size > DROP_MIN_SIZE:
-            self.break_drop()
-            
-        # Update wobble
-        self.wobble += 0.1 * self.wobble_direction
-        if abs(self.wobble) > TENSION_WOBBLE:
-            self.wobble_direction *= -1
-            
-        self.y += self.velocity
-        
-        # Canal interaction with surface tension
-        for canal in canals:
-            if abs(self.y - canal.y) < CANAL_RANGE_VERTICAL:
-                dx = canal.x - self.x
-                dist = abs(dx)
-                if dist < CANAL_RANGE_HORIZONTAL:
-                    pull = (CANAL_RANGE_HORIZONTAL - dist) / CANAL_RANGE_HORIZONTAL * canal.strength
-                    # Surface tension resists sudden movements
-                    pull *= (1 - SURFACE_TENSION * 0.5)
-                    self.x += dx * pull * CANAL_PULL_STRENGTH
-
-        if self.y > height:
-            self.alive = False
-
-    def break_drop(self):
-        # Drop breaks into two smaller drops due to stretching
-        self.size *= 0.7
-        self.stretch *= 0.5
-        self.surface_energy = self.size * SURFACE_TENSION
-
-    def draw(self, screen):
-        # Calculate drop shape based on surface tension
-        base_stretch = 1 + (self.stretch * DROP_STRETCH_FACTOR)
-        wobble_effect = 1 + self.wobble
-        
-        # More rounded shape when surface tension is high
-        roundness = TENSION_ROUNDNESS * (1 - self.stretch)
-        width = int(self.size * (2 - self.stretch * (1 - roundness)))
-        height = int(self.size * base_stretch * wobble_effect)
-        
-        # Draw main drop body
-        pygame.draw.ellipse(screen, (150, 150, 255), 
-                          (int(self.x - width/2), int(self.y - height/2),
-                           width, height))
-        
-        # Add highlight to show surface tension
-        if SURFACE_TENSION > 0.2:
-            highlight_size = max(1, int(width * 0.3))
-            pygame.draw.ellipse(screen, (200, 200, 255),
-                              (int(self.x - width/4), int(self.y - height/4),
-                               highlight_size, highlight_size))
-
-    def check_collision(self, other: 'Drop') -> bool:
-        # Surface tension affects collision range
-        base_range = (self.size + other.size) * DROP_COLLISION_FACTOR
-        # Drops are more likely to merge when surface tension is high
-        tension_range = base_range * (1 + TENSION_MERGE_THRESHOLD * SURFACE_TENSION)
-        
-        distance = np.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
-        return distance < tension_range
+        self.dx[new] = 0  # Horizontal velocity
+        self.movement_timer[new] = self.rng.random(count, dtype=np.float32) * 6.28  # Random starting phase
+        self.n += count
+        return new
+
+    def compact(self):
+        # Move the live drops to the front of every column. Drops before the
+        # first dead one are already in place, and most frames nothing dies
+        dead = np.flatnonzero(~self.alive[:self.n])
+        if not len(dead):
+            return
+        first = dead[0]
+        keep = first + np.flatnonzero(self.alive[first:self.n])
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            column[first:first + len(keep)] = column[keep]
+        self.n = first + len(keep)
+
+class SpatialHash:
+    # Uniform grid mapping cell (x // cell, y // cell) to the indices of the points in it
+    def __init__(self, cell: float, x: np.ndarray, y: np.ndarray):
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        keys = zip((x // cell).astype(int).tolist(), (y // cell).astype(int).tolist())
+        for i, key in enumerate(keys):
+            self.cells.setdefault(key, []).append(i)
+
+    def pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Candidate pairs (i < j) of points in the same or adjacent cells, sorted by i then j
+        first, second = [], []
+        for (cell_x, cell_y), members in self.cells.items():
+            for offset_x in (-1, 0, 1):
+                for offset_y in (-1, 0, 1):
+                    neighbors = self.cells.get((cell_x + offset_x, cell_y + offset_y))
+                    if neighbors:
+                        for i in members:
+                            for j in neighbors:
+                                if i < j:
+                                    first.append(i)
+                                    second.append(j)
+        first, second = np.array(first, dtype=int), np.array(second, dtype=int)
+        order = np.lexsort((second, first))
+        return first[order], second[order]
 
 class WaterDrops:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.drops: List[Drop] = []
-        self.canals: List[Canal] = []
+        self.rng = np.random.default_rng()
+        self.drops = DropPool(self.rng)
         self.spawn_timer = 0
         self.spawn_rate = DROP_SPAWN_RATE
         self.min_size = DROP_MIN_SIZE
         self.max_size = DROP_MAX_SIZE
-        self.canal_grid = {}
+        # Canals by grid point, least recently fed first
+        self.canal_grid: 'OrderedDict[Tuple[int, int], Canal]' = OrderedDict()
         self.grid_size = CANAL_GRID_SIZE
+        self.canal_surfaces: Dict[Tuple[int, int], pygame.Surface] = {}
+        self.drop_sprites: Dict[Tuple[int, int], pygame.Surface] = {}
+        # Canals are drawn onto a persistent layer; only canals that were added,
+        # removed or changed look are repainted, and the areas the drops covered
+        # last frame are restored from the layer
+        self.canal_layer = None
+        self.drawn_canals: Dict[Tuple[int, int], pygame.Rect] = {}
+        self.changed_canals = set()
+        self.drop_rects: List[pygame.Rect] = []
 
     def spawn_drop(self):
-        center_x = random.randint(0, self.width)
-        num_drops = random.randint(*DROP_CLUSTER_SIZE)
+        # Spawn a whole cluster of drops at once
+        center_x = self.rng.integers(0, self.width, endpoint=True)
+        num_drops = self.rng.integers(DROP_CLUSTER_SIZE[0], DROP_CLUSTER_SIZE[1], endpoint=True)
         
-        for _ in range(num_drops):
-            x = center_x + random.gauss(0, DROP_CLUSTER_SPREAD)
-            x = max(0, min(x, self.width))
-            size = random.uniform(self.min_size, self.max_size)
-            self.drops.append(Drop(x, 0, size))
+        x = np.clip(center_x + self.rng.normal(0, DROP_CLUSTER_SPREAD, num_drops), 0, self.width)
+        size = self.rng.uniform(self.min_size, self.max_size, num_drops)
+        self.drops.add(x, 0, size)
 
     def add_canal(self, x: float, y: float, drop_size: float):
         grid_x = round(x / self.grid_size) * self.grid_size
@@ -208,10 +189,133 @@ class WaterDrops:
         if key not in self.canal_grid:
             width = min(CANAL_MAX_WIDTH, drop_size)
             self.canal_grid[key] = Canal(grid_x, grid_y, strength=CANAL_STRENGTH_INCREASE, initial_width=width)
-            self.canals.append(self.canal_grid[key])
+            self.changed_canals.add(key)
+            if len(self.canal_grid) > CANAL_MAX_COUNT:
+                self.changed_canals.add(self.canal_grid.popitem(last=False)[0])
         else:
-            self.canal_grid[key].strength = min(1.0, self.canal_grid[key].strength + CANAL_STRENGTH_INCREASE)
-            self.canal_grid[key].width = min(CANAL_MAX_WIDTH, self.canal_grid[key].width + CANAL_WIDTH_GROWTH)
+            self.canal_grid.move_to_end(key)
+            canal = self.canal_grid[key]
+            canal.strength = min(1.0, canal.strength + CANAL_STRENGTH_INCREASE)
+            old_width = int(canal.width)
+            canal.width = min(CANAL_MAX_WIDTH, canal.width + CANAL_WIDTH_GROWTH)
+            if int(canal.width) != old_width:
+                self.changed_canals.add(key)
+
+    def _step_drops(self):
+        # Advance every live drop by one frame
+        drops = self.drops
+        n = drops.n
+        x, y, dx, velocity = drops.x[:n], drops.y[:n], drops.dx[:n], drops.velocity[:n]
+        size, speed, stretch = drops.size[:n], drops.speed[:n], drops.stretch[:n]
+        wobble = drops.wobble[:n]
+        
+        # Update movement timer
+        timer = drops.movement_timer[:n]
+        timer += 0.05
+        
+        # Random sideways movement
+        random_force = np.sin(timer) * RANDOM_MOVEMENT
+        wind = WIND_EFFECT * (1 + 0.2 * np.sin(timer * 0.5))
+        
+        # Update horizontal velocity with momentum
+        dx[:] = dx * MOMENTUM_FACTOR + (random_force + wind) * 0.2
+        x += dx
+        
+        # Base velocity
+        transition = self.height * SPEED_TRANSITION_HEIGHT
+        progress = (y - transition) / (self.height * (1 - SPEED_TRANSITION_HEIGHT))
+        target_velocity = np.where(y > transition, speed * (1 + progress * BOTTOM_SPEED_MULTIPLIER), speed)
+
+        # Surface tension affects acceleration
+        tension_factor = 1.0 - (stretch * SURFACE_TENSION)
+        velocity += (target_velocity - velocity) * 0.1 * tension_factor
+        
+        # Update stretch based on total movement (vertical and horizontal)
+        total_velocity = np.hypot(velocity, dx)
+        target_stretch = (total_velocity / speed - 1) * (1 - TENSION_ROUNDNESS)
+        stretch += (target_stretch - stretch) * 0.1
+        
+        # Limit stretch; drops stretched to the break point break
+        # into a smaller drop due to stretching
+        np.minimum(stretch, TENSION_BREAK_POINT, out=stretch)
+        breaking = (stretch >= TENSION_BREAK_POINT) & (size > DROP_MIN_SIZE)
+        size[breaking] *= 0.7
+        stretch[breaking] *= 0.5
+            
+        # Update wobble; the timer advances 0.05 per frame, so it repeats every 20 frames
+        wobble[:] = TENSION_WOBBLE * np.sin(timer * (2 * math.pi))
+            
+        y += velocity
+        
+        # Canal interaction with surface tension. Canals sit on canal_grid points, so only
+        # the grid points around a drop can be in range. Each canal's pull moves the
+        # drop before the next canal is checked, so one extra column on each side
+        # covers canals the drop is pulled into range of
+        if self.canal_grid:
+            grid = self.grid_size
+            columns = math.ceil(CANAL_RANGE_HORIZONTAL / grid + 0.5)
+            rows = math.ceil(CANAL_RANGE_VERTICAL / grid + 0.5) - 1
+            offsets = [(column * grid, row * grid) for column in range(-columns, columns + 1)
+                       for row in range(-rows, rows + 1)]
+            # Globals and attributes used per drop and offset are bound to locals
+            find_canal = self.canal_grid.get
+            range_horizontal, range_vertical = CANAL_RANGE_HORIZONTAL, CANAL_RANGE_VERTICAL
+            # Surface tension resists sudden movements
+            pull_factor = (1 - SURFACE_TENSION * 0.5) * CANAL_PULL_STRENGTH
+            new_x = []
+            for drop_x, drop_y in zip(x.tolist(), y.tolist()):
+                grid_x = round(drop_x / grid) * grid
+                grid_y = round(drop_y / grid) * grid
+                for offset_x, offset_y in offsets:
+                    canal = find_canal((grid_x + offset_x, grid_y + offset_y))
+                    if canal is not None and abs(drop_y - canal.y) < range_vertical:
+                        dx_canal = canal.x - drop_x
+                        dist = abs(dx_canal)
+                        if dist < range_horizontal:
+                            pull = (range_horizontal - dist) / range_horizontal * canal.strength
+                            drop_x += dx_canal * pull * pull_factor
+                new_x.append(drop_x)
+            x[:] = new_x
+
+        drops.alive[:n][y > self.height] = False
+
+    def _merge_drops(self):
+        # Find all colliding pairs at once, then merge them in pair order
+        drops = self.drops
+        n = drops.n
+        if n < 2:
+            return
+        x, y, size = drops.x[:n], drops.y[:n], drops.size[:n]
+        # Surface tension affects collision range; drops are more likely
+        # to merge when surface tension is high
+        tension_factor = DROP_COLLISION_FACTOR * (1 + TENSION_MERGE_THRESHOLD * SURFACE_TENSION)
+        if n < SPATIAL_HASH_MIN_DROPS:
+            tension_range2 = ((size[:, None] + size[None, :]) * tension_factor)**2
+            distance2 = (x[:, None] - x[None, :])**2 + (y[:, None] - y[None, :])**2
+            i, j = np.nonzero(np.triu(distance2 < tension_range2, 1))
+        else:
+            # Colliding drops are less than 2 * max size apart, so with cells that size
+            # only drops in the same or adjacent cells need testing
+            i, j = SpatialHash(2 * size.max(), x, y).pairs()
+            tension_range2 = ((size[i] + size[j]) * tension_factor)**2
+            colliding = (x[i] - x[j])**2 + (y[i] - y[j])**2 < tension_range2
+            i, j = i[colliding], j[colliding]
+        if not len(i):
+            return
+        
+        # Drops merged this frame are added as new drops, which can merge on the next frame
+        x, y, size = x.tolist(), y.tolist(), size.tolist()
+        velocity, alive = drops.velocity[:n].tolist(), drops.alive[:n].tolist()
+        for first, second in zip(i.tolist(), j.tolist()):
+            if alive[first] and alive[second]:
+                new_size = math.hypot(size[first], size[second])
+                new_x = (x[first] * size[first] + x[second] * size[second]) / (size[first] + size[second])
+                new_y = (y[first] * size[first] + y[second] * size[second]) / (size[first] + size[second])
+                new_drop = drops.add(new_x, new_y, new_size)
+                drops.velocity[new_drop] = max(velocity[first], velocity[second])
+                alive[first] = False
+                alive[second] = False
+        drops.alive[:n] = alive
 
     def update(self):
         self.spawn_timer += 1
@@ -219,36 +323,99 @@ class WaterDrops:
             self.spawn_drop()
             self.spawn_timer = 0
 
-        for canal in self.canals:
-            canal.update()
-
-        for drop in self.drops:
-            old_pos = (drop.x, drop.y)
-            drop.update(self.height, self.canals)
+        changed_canals = self.changed_canals
+        for key, canal in self.canal_grid.items():
+            if canal.update():
+                changed_canals.add(key)
+
+        self._step_drops()
+        drops = self.drops
+        n = drops.n
+        moving = np.flatnonzero(drops.velocity[:n] > 1)  # Create canals for moving drops
+        for x, y, size in zip(drops.x[moving].tolist(), drops.y[moving].tolist(), drops.size[moving].tolist()):
+            self.add_canal(x, y, size)
+
+        self._merge_drops()
+        drops.compact()
+
+    def canal_surface(self, width: int, alpha: int) -> pygame.Surface:
+        # Canals are drawn from shared surfaces, one per (width, alpha)
+        key = (width, alpha)
+        if key not in self.canal_surfaces:
+            canal_surface = pygame.Surface((width, 2), pygame.SRCALPHA)  # Thinner canals
+            canal_surface.fill((150, 150, 255, alpha))
+            self.canal_surfaces[key] = canal_surface
+        return self.canal_surfaces[key]
+
+    def drop_sprite(self, width: int, height: int) -> pygame.Surface:
+        # Drop body and highlight, rendered once per (width, height); black is transparent
+        key = (width, height)
+        if key not in self.drop_sprites:
+            highlight_size = max(1, int(width * 0.3))
+            sprite = pygame.Surface((max(width, int(width/4) + highlight_size),
+                                     max(height, int(height/4) + highlight_size))).convert()
+            sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            
+            # Draw main drop body
+            pygame.draw.ellipse(sprite, (150, 150, 255), (0, 0, width, height))
             
-            if drop.velocity > 1:  # Create canals for moving drops
-                self.add_canal(drop.x, drop.y, drop.size)
-
-        # Merge colliding drops
-        for i, drop1 in enumerate(self.drops):
-            for j, drop2 in enumerate(self.drops[i+1:], i+1):
-                if drop1.alive and drop2.alive and drop1.check_collision(drop2):
-                    new_size = np.sqrt(drop1.size**2 + drop2.size**2)
-                    new_x = (drop1.x * drop1.size + drop2.x * drop2.size) / (drop1.size + drop2.size)
-                    new_y = (drop1.y * drop1.size + drop2.y * drop2.size) / (drop1.size + drop2.size)
-                    new_drop = Drop(new_x, new_y, new_size)
-                    new_drop.velocity = max(drop1.velocity, drop2.velocity)
-                    drop1.alive = False
-                    drop2.alive = False
-                    self.drops.append(new_drop)
-
-        self.drops = [drop for drop in self.drops if drop.alive]
-
-    def draw(self, screen):
-        for canal in self.canals:
-            canal.draw(screen)
-        for drop in self.drops:
-            drop.draw(screen)
+            # Add highlight to show surface tension
+            if SURFACE_TENSION > 0.2:
+                pygame.draw.ellipse(sprite, (200, 200, 255),
+                                  (int(width/4), int(height/4), highlight_size, highlight_size))
+            self.drop_sprites[key] = sprite
+        return self.drop_sprites[key]
+
+    def repaint_canals(self) -> List[pygame.Rect]:
+        # Erase changed canals from the layer and draw them as they are now.
+        # Canals sit on distinct grid points and are narrower than the grid,
+        # so each one can be repainted on its own
+        layer = self.canal_layer
+        drawn_canals = self.drawn_canals
+        canal_surface = self.canal_surface
+        rects = []
+        for key in self.changed_canals:
+            old_rect = drawn_canals.pop(key, None)
+            if old_rect is not None:
+                layer.fill((0, 0, 0), old_rect)
+                rects.append(old_rect)
+            canal = self.canal_grid.get(key)
+            if canal is not None:
+                rect = canal.rect()
+                layer.blit(canal_surface(rect.width, canal.alpha), rect)
+                drawn_canals[key] = rect
+                rects.append(rect)
+        self.changed_canals.clear()
+        return rects
+
+    def draw(self, screen) -> List[pygame.Rect]:
+        # Returns the areas that changed, so the caller can update just those
+        if self.canal_layer is None:
+            self.canal_layer = pygame.Surface(screen.get_size()).convert()
+            self.canal_layer.fill((0, 0, 0))
+        # Restore what the drops covered last frame and copy repainted canals over
+        rects = self.drop_rects + self.repaint_canals()
+        layer = self.canal_layer
+        screen.blits([(layer, rect, rect) for rect in rects], doreturn=False)
+
+        drops = self.drops
+        n = drops.n
+        size, stretch = drops.size[:n], drops.stretch[:n]
+        # Calculate drop shapes based on surface tension
+        base_stretch = 1 + (stretch * DROP_STRETCH_FACTOR)
+        wobble_effect = 1 + drops.wobble[:n]
+        
+        # More rounded shape when surface tension is high
+        roundness = TENSION_ROUNDNESS * (1 - stretch)
+        width = (size * (2 - stretch * (1 - roundness))).astype(int)
+        height = (size * base_stretch * wobble_effect).astype(int)
+        left = (drops.x[:n] - width/2).astype(int)
+        top = (drops.y[:n] - height/2).astype(int)
+        
+        drop_sprite = self.drop_sprite
+        self.drop_rects = screen.blits([(drop_sprite(w, h), (x, y)) for w, h, x, y in
+                                        zip(width.tolist(), height.tolist(), left.tolist(), top.tolist())])
+        return rects + self.drop_rects
 
 def main():
     try:
@@ -260,22 +427,36 @@ def main():
         width, height = info.current_w, info.current_h
         print(f"Screen dimensions: {width}x{height}")
         
+        vsync = True
         try:
-            screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
+            # Vsync needs the SCALED flag; flip() then waits for the display refresh
+            screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN | pygame.SCALED, vsync=1)
         except pygame.error as e:
-            print(f"Failed to set fullscreen mode: {e}")
-            print("Trying windowed mode instead...")
-            screen = pygame.display.set_mode((800, 600))
+            print(f"Vsync unavailable: {e}")
+            vsync = False
+            try:
+                screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
+            except pygame.error as e:
+                print(f"Failed to set fullscreen mode: {e}")
+                print("Trying windowed mode instead...")
+                screen = pygame.display.set_mode((800, 600))
         
         clock = pygame.time.Clock()
         print("Display setup complete")
 
         simulation = WaterDrops(width, height)  # Use full width now
         print("Simulation created")
-
+        
+        # The simulation advances in fixed 60 Hz steps however long frames take
+        step_ms = 1000 / 60
+        accumulator = 0.0
         running = True
         while running:
-            clock.tick(60)  # Simplified timing
+            # With vsync, flip() paces frames; the loose cap only guards against
+            # drivers that accept vsync without honoring it
+            elapsed = clock.tick(120) if vsync else clock.tick_busy_loop(60)
+            # After a long stall, skip ahead instead of running a burst of catch-up steps
+            accumulator += min(elapsed, 4 * step_ms)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -284,12 +465,14 @@ def main():
                     if event.key == pygame.K_ESCAPE:
                         running = False
 
-            # Draw simulation
-            screen.fill((0, 0, 0))
-            simulation.update()
-            simulation.draw(screen)
-            
-            pygame.display.flip()
+            while accumulator >= step_ms:
+                simulation.update()
+                accumulator -= step_ms
+
+            # Draw simulation. Without SCALED only the changed areas are sent to the
+            # display; with it every update presents the whole frame, so the saving
+            # there is in not redrawing the canals
+            pygame.display.update(simulation.draw(screen))
 
     except Exception as e:
         print(f"An error occurred: {e}")